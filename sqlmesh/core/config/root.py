@@ -91,13 +91,13 @@ class Config(BaseConfig):
     default_test_connection_: t.Optional[SerializableConnectionConfig] = Field(
         default=None, alias="default_test_connection"
     )
-    default_scheduler: SchedulerConfig = BuiltInSchedulerConfig()
+    default_scheduler: SchedulerConfig = Field(default_factory=BuiltInSchedulerConfig)
     default_gateway: str = ""
-    notification_targets: t.List[NotificationTarget] = []
+    notification_targets: t.List[NotificationTarget] = Field(default_factory=list)
     project: str = ""
     snapshot_ttl: str = c.DEFAULT_SNAPSHOT_TTL
     environment_ttl: t.Optional[str] = c.DEFAULT_ENVIRONMENT_TTL
-    ignore_patterns: t.List[str] = c.IGNORE_PATTERNS
+    ignore_patterns: t.List[str] = Field(default_factory=lambda: list(c.IGNORE_PATTERNS))
     time_column_format: str = c.DEFAULT_TIME_COLUMN_FORMAT
     users: t.List[User] = []
     model_defaults: ModelDefaultsConfig = ModelDefaultsConfig()
@@ -149,7 +149,8 @@ class Config(BaseConfig):
     def _gateways_ensure_dict(cls, value: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
         try:
             if not isinstance(value, GatewayConfig):
-                GatewayConfig.parse_obj(value)
+                # Reuse the parsed instance so that the gateway isn't validated twice
+                value = GatewayConfig.parse_obj(value)
             return {"": value}
         except Exception:
             return value
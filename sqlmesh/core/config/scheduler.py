@@ -4,31 +4,28 @@ import abc
 import logging
 import sys
 import typing as t
+from functools import cached_property, lru_cache
 
 from pydantic import Field
-from requests import Session
 
 from sqlglot.helper import subclasses
 from sqlmesh.core.config.base import BaseConfig
 from sqlmesh.core.config.common import concurrent_tasks_validator
 from sqlmesh.core.console import Console
-from sqlmesh.core.plan import (
-    AirflowPlanEvaluator,
-    BuiltInPlanEvaluator,
-    MWAAPlanEvaluator,
-    PlanEvaluator,
-)
-from sqlmesh.core.state_sync import EngineAdapterStateSync, StateSync
-from sqlmesh.schedulers.airflow.client import AirflowClient
-from sqlmesh.schedulers.airflow.mwaa_client import MWAAClient
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.hashing import md5
 from sqlmesh.utils.pydantic import model_validator, model_validator_v1_args, field_validator
 
 if t.TYPE_CHECKING:
+    from google.auth.credentials import Credentials
     from google.auth.transport.requests import AuthorizedSession
+    from requests import Session
 
     from sqlmesh.core.context import GenericContext
+    from sqlmesh.core.plan import PlanEvaluator
+    from sqlmesh.core.state_sync import StateSync
+    from sqlmesh.schedulers.airflow.client import AirflowClient
+    from sqlmesh.schedulers.airflow.mwaa_client import MWAAClient
 
 if sys.version_info >= (3, 9):
     from typing import Literal
@@ -80,6 +77,8 @@ class SchedulerConfig(abc.ABC):
 
 class _EngineAdapterStateSyncSchedulerConfig(SchedulerConfig):
     def create_state_sync(self, context: GenericContext) -> StateSync:
+        from sqlmesh.core.state_sync import EngineAdapterStateSync
+
         state_connection = (
             context.config.get_state_connection(context.gateway) or context._connection_config
         )
@@ -129,12 +128,14 @@ class _EngineAdapterStateSyncSchedulerConfig(SchedulerConfig):
         )
 
 
-class BuiltInSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig):
+class BuiltInSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig, frozen=True):
     """The Built-In Scheduler configuration."""
 
     type_: Literal["builtin"] = Field(alias="type", default="builtin")
 
     def create_plan_evaluator(self, context: GenericContext) -> PlanEvaluator:
+        from sqlmesh.core.plan import BuiltInPlanEvaluator
+
         return BuiltInPlanEvaluator(
             state_sync=context.state_sync,
             snapshot_evaluator=context.snapshot_evaluator,
@@ -182,6 +183,8 @@ class _BaseAirflowSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig):
         return md5([self.airflow_url])
 
     def create_plan_evaluator(self, context: GenericContext) -> PlanEvaluator:
+        from sqlmesh.core.plan import AirflowPlanEvaluator
+
         return AirflowPlanEvaluator(
             airflow_client=self.get_client(context.console),
             dag_run_poll_interval_secs=self.dag_run_poll_interval_secs,
@@ -212,7 +215,7 @@ max_snapshot_ids_per_request_validator: t.Any = field_validator(
 )(_max_snapshot_ids_per_request_validator)
 
 
-class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig):
+class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, frozen=True):
     """The Airflow Scheduler configuration.
 
     Args:
@@ -252,21 +255,51 @@ class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig):
     _concurrent_tasks_validator = concurrent_tasks_validator
     _max_snapshot_ids_per_request_validator = max_snapshot_ids_per_request_validator
 
-    def get_client(self, console: t.Optional[Console] = None) -> AirflowClient:
+    @cached_property
+    def session(self) -> Session:
+        # The session is shared by all clients created from this config, so that the plan
+        # evaluator and the state sync reuse the same connection pool
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+
         session = Session()
+        # Connection errors are retried, since pooled keep-alive connections may have been closed
+        # by the webserver
+        adapter = HTTPAdapter(max_retries=3)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
         if self.token is None:
             session.auth = (self.username, self.password)
         else:
             session.headers.update({"Authorization": f"Bearer {self.token}"})
+        return session
+
+    def get_client(self, console: t.Optional[Console] = None) -> AirflowClient:
+        from sqlmesh.schedulers.airflow.client import AirflowClient
 
         return AirflowClient(
-            session=session,
+            session=self.session,
             airflow_url=self.airflow_url,
             console=console,
         )
 
 
-class CloudComposerSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, extra="allow"):
+@lru_cache(maxsize=None)
+def _google_default_credentials(scopes: t.Tuple[str, ...]) -> Credentials:
+    """Resolves the default Google credentials once per process.
+
+    Resolving the default credentials requires disk access and potentially a round-trip to the
+    metadata server. The returned credentials refresh their own access token once it expires.
+    """
+    import google.auth
+
+    return google.auth.default(scopes=list(scopes))[0]
+
+
+class CloudComposerSchedulerConfig(
+    _BaseAirflowSchedulerConfig, BaseConfig, extra="allow", frozen=True
+):
     """The Google Cloud Composer configuration.
 
     Args:
@@ -301,23 +334,28 @@ class CloudComposerSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, extr
     _concurrent_tasks_validator = concurrent_tasks_validator
     _max_snapshot_ids_per_request_validator = max_snapshot_ids_per_request_validator
 
+    _session: t.Optional[AuthorizedSession] = None
+
     def __init__(self, **data: t.Any) -> None:
         super().__init__(**data)
-        self._session: t.Optional[AuthorizedSession] = data.get("session")
+        self._session = data.get("session")
 
-    @property
+    @cached_property
     def session(self) -> AuthorizedSession:
-        import google.auth
+        if self._session is not None:
+            return self._session
+
         from google.auth.transport.requests import AuthorizedSession
 
-        if self._session is None:
-            self._session = AuthorizedSession(
-                google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])[0]
-            )
-            self._session.headers.update({"Content-Type": "application/json"})
-        return self._session
+        session = AuthorizedSession(
+            _google_default_credentials(("https://www.googleapis.com/auth/cloud-platform",))
+        )
+        session.headers.update({"Content-Type": "application/json"})
+        return session
 
     def get_client(self, console: t.Optional[Console] = None) -> AirflowClient:
+        from sqlmesh.schedulers.airflow.client import AirflowClient
+
         return AirflowClient(
             airflow_url=self.airflow_url,
             session=self.session,
@@ -336,7 +374,7 @@ class CloudComposerSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, extr
         return values
 
 
-class MWAASchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig):
+class MWAASchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig, frozen=True):
     """The AWS MWAA Scheduler configuration.
 
     Args:
@@ -366,9 +404,13 @@ class MWAASchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig):
     _concurrent_tasks_validator = concurrent_tasks_validator
 
     def get_client(self, console: t.Optional[Console] = None) -> MWAAClient:
+        from sqlmesh.schedulers.airflow.mwaa_client import MWAAClient
+
         return MWAAClient(self.environment, console=console)
 
     def create_plan_evaluator(self, context: GenericContext) -> PlanEvaluator:
+        from sqlmesh.core.plan import MWAAPlanEvaluator
+
         return MWAAPlanEvaluator(
             client=self.get_client(context.console),
             state_sync=context.state_sync,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import typing as t
-from functools import cached_property
 
 from sqlmesh import Model
 from sqlmesh.core.context import ExecutionContext
@@ -34,12 +33,11 @@ class TestExecutionContext(ExecutionContext):
         self._default_dialect = default_dialect
         self._variables = variables or {}
 
-    @cached_property
+    @property
     def _model_tables(self) -> t.Dict[str, str]:
         """Returns a mapping of model names to tables."""
-        return {
-            name: self._test._test_fixture_table(name).sql() for name, model in self._models.items()
-        }
+        # The mapping is cached by the test, so it's shared with the contexts created by `with_variables`
+        return self._test._model_fixture_tables
 
     def with_variables(self, variables: t.Dict[str, t.Any]) -> TestExecutionContext:
         """Returns a new TestExecutionContext with additional variables."""
@@ -3,16 +3,15 @@ from __future__ import annotations
 import datetime
 import typing as t
 import unittest
-from collections import Counter
-from contextlib import AbstractContextManager, nullcontext
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import cached_property, lru_cache
 from pathlib import Path
-from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 from io import StringIO
-from freezegun import freeze_time
-from pandas.api.types import is_object_dtype
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype, is_object_dtype
+from pandas.core.dtypes.cast import maybe_box_native
 from sqlglot import Dialect, exp
 from sqlglot.optimizer.annotate_types import annotate_types
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
@@ -41,6 +40,22 @@ TIME_KWARG_KEYS = {
     *date_dict(execution_time="1970-01-01", start="1970-01-01", end="1970-01-01").keys(),
 }
 
+_ROW_OCCURRENCE = "__sqlmesh_row_occurrence__"
+
+# The results of pandas' `infer_dtype` for object columns whose values are hashable scalars that
+# `Series.map` leaves as they are, i.e. it doesn't convert them into a different dtype
+_HASHABLE_INFERRED_TYPES = {"boolean", "bytes", "date", "decimal", "empty", "string", "time"}
+
+# The maximum number of differing rows that are shown when a test fails
+_MAX_DIFF_ROWS = 50
+
+# The Python types whose values are always inferred as the same data type, e.g. unlike decimals,
+# which are inferred as INT or DOUBLE depending on whether they have a fractional part
+_CACHEABLE_SCALAR_TYPES = {str, int, float, bool, datetime.date, datetime.datetime}
+
+# The data types inferred for input values of the above types, keyed by Python type and test dialect
+_SCALAR_DATA_TYPES: t.Dict[t.Tuple[t.Type, Dialect], exp.DataType] = {}
+
 
 class ModelTest(unittest.TestCase):
     __test__ = False
@@ -80,8 +95,6 @@ class ModelTest(unittest.TestCase):
         self.dialect = dialect
 
         self._fixture_table_cache: t.Dict[str, exp.Table] = {}
-        self._normalized_column_name_cache: t.Dict[str, str] = {}
-        self._normalized_model_name_cache: t.Dict[t.Tuple[str, bool], str] = {}
 
         self._test_adapter_dialect = Dialect.get_or_raise(self.engine_adapter.dialect)
 
@@ -101,6 +114,11 @@ class ModelTest(unittest.TestCase):
         )
         self._qualified_fixture_schema = schema_(self._fixture_schema, self._fixture_catalog)
 
+        # The model query is rendered against the same fixture tables in every run of the test
+        self._input_fixture_tables = {
+            name: self._test_fixture_table(name).sql() for name in self.body.get("inputs", {})
+        }
+
         self._transforms = self._test_adapter_dialect.generator_class.TRANSFORMS
         self._execution_time = str(self.body.get("vars", {}).get("execution_time") or "")
 
@@ -124,57 +142,59 @@ class ModelTest(unittest.TestCase):
         """Load all input tables"""
         self.engine_adapter.create_schema(self._qualified_fixture_schema)
 
-        for name, values in self.body.get("inputs", {}).items():
-            all_types_are_known = False
-            known_columns_to_types: t.Dict[str, exp.DataType] = {}
-
-            model = self.models.get(name)
-            if model:
-                inferred_columns_to_types = model.columns_to_types or {}
-                known_columns_to_types = {
-                    c: t for c, t in inferred_columns_to_types.items() if type_is_known(t)
-                }
-                all_types_are_known = bool(inferred_columns_to_types) and (
-                    len(known_columns_to_types) == len(inferred_columns_to_types)
-                )
-
-            # Types specified in the test will override the corresponding inferred ones
-            known_columns_to_types.update(values.get("columns", {}))
+        # All fixtures live in the same schema, so their views are created in a single transaction
+        with self.engine_adapter.transaction():
+            for name, values in self.body.get("inputs", {}).items():
+                self.engine_adapter.create_view(*self._fixture(name, values))
+
+    def _fixture(
+        self, name: str, values: t.Dict[str, t.Any]
+    ) -> t.Tuple[exp.Table, exp.Query | pd.DataFrame, t.Dict[str, exp.DataType]]:
+        all_types_are_known = False
+        known_columns_to_types: t.Dict[str, exp.DataType] = {}
+
+        model = self.models.get(name)
+        if model:
+            inferred_columns_to_types = model.columns_to_types or {}
+            known_columns_to_types = {
+                c: t for c, t in inferred_columns_to_types.items() if type_is_known(t)
+            }
+            all_types_are_known = bool(inferred_columns_to_types) and (
+                len(known_columns_to_types) == len(inferred_columns_to_types)
+            )
 
-            rows = values.get("rows")
-            if not all_types_are_known and rows:
-                for col, value in rows[0].items():
-                    if col not in known_columns_to_types:
-                        v_type = annotate_types(exp.convert(value)).type or type(value).__name__
-                        v_type = exp.maybe_parse(
-                            v_type, into=exp.DataType, dialect=self._test_adapter_dialect
+        # Types specified in the test will override the corresponding inferred ones
+        known_columns_to_types.update(values.get("columns", {}))
+
+        rows = values.get("rows")
+        if not all_types_are_known and rows:
+            for col, value in rows[0].items():
+                if col not in known_columns_to_types:
+                    v_type = _infer_data_type(value, self._test_adapter_dialect)
+
+                    if not type_is_known(v_type):
+                        _raise_error(
+                            f"Failed to infer the data type of column '{col}' for '{name}'. This issue can be "
+                            "mitigated by casting the column in the model definition, setting its type in "
+                            "external_models.yaml if it's an external model, setting the model's 'columns' property, "
+                            "or setting its 'columns' mapping in the test itself",
+                            self.path,
                         )
 
-                        if not type_is_known(v_type):
-                            _raise_error(
-                                f"Failed to infer the data type of column '{col}' for '{name}'. This issue can be "
-                                "mitigated by casting the column in the model definition, setting its type in "
-                                "external_models.yaml if it's an external model, setting the model's 'columns' property, "
-                                "or setting its 'columns' mapping in the test itself",
-                                self.path,
-                            )
-
-                        known_columns_to_types[col] = v_type
-
-            if rows is None:
-                query_or_df: exp.Query | pd.DataFrame = self._add_missing_columns(
-                    values["query"], known_columns_to_types
-                )
-                if known_columns_to_types:
-                    known_columns_to_types = {
-                        col: known_columns_to_types[col] for col in query_or_df.named_selects
-                    }
-            else:
-                query_or_df = self._create_df(values, columns=known_columns_to_types)
+                    known_columns_to_types[col] = v_type
 
-            self.engine_adapter.create_view(
-                self._test_fixture_table(name), query_or_df, known_columns_to_types
+        if rows is None:
+            query_or_df: exp.Query | pd.DataFrame = self._add_missing_columns(
+                values["query"], known_columns_to_types
             )
+            if known_columns_to_types:
+                known_columns_to_types = {
+                    col: known_columns_to_types[col] for col in query_or_df.named_selects
+                }
+        else:
+            query_or_df = self._create_df(values, columns=known_columns_to_types)
+
+        return self._test_fixture_table(name), query_or_df, known_columns_to_types
 
     def tearDown(self) -> None:
         """Drop all fixture tables."""
@@ -194,12 +214,21 @@ class ModelTest(unittest.TestCase):
             if len(intersection.columns) > 0:
                 actual = intersection
 
-        # Two astypes are necessary, pandas converts strings to times as NS,
-        # but if the actual is US, it doesn't take effect until the 2nd try!
         actual_types = actual.dtypes.to_dict()
-        expected = expected.astype(actual_types, errors="ignore").astype(
-            actual_types, errors="ignore"
-        )
+        expected = expected.astype(actual_types, errors="ignore")
+
+        # Pandas may convert strings to times as NS even if the actual is US, in which case the
+        # cast doesn't take effect until the 2nd try, so only these datetime columns are cast again
+        expected_types = expected.dtypes.to_dict()
+        mismatched_datetime_types = {
+            col: dtype
+            for col, dtype in actual_types.items()
+            if is_datetime64_any_dtype(dtype)
+            and col in expected_types
+            and expected_types[col] != dtype
+        }
+        if mismatched_datetime_types:
+            expected = expected.astype(mismatched_datetime_types, errors="ignore")
 
         # The `actual` df's dtypes will almost always be pd.Timestamp for datetime values,
         # but in some scenarios (e.g., DuckDB >=0.10.2) it will be a pandas `object` type
@@ -226,20 +255,26 @@ class ModelTest(unittest.TestCase):
             elif type(value) is datetime.datetime:
                 expected[col] = pd.to_datetime(expected[col], errors="ignore").dt.to_pydatetime()  # type: ignore
 
-        actual = actual.replace({np.nan: None})
-        expected = expected.replace({np.nan: None})
-
-        def _to_hashable(x: t.Any) -> t.Any:
-            if isinstance(x, (list, np.ndarray)):
-                return tuple(_to_hashable(v) for v in x)
-            if isinstance(x, dict):
-                return tuple((k, _to_hashable(v)) for k, v in x.items())
-            return str(x) if not isinstance(x, t.Hashable) else x
+        # Fast path for the common case where the test passes and the rows are in the same order.
+        # `equals` requires the same dtypes and values, so the normalization below is unnecessary.
+        if actual.equals(expected):
+            return
+
+        # NaNs already compare as equal in columns that share a non-object dtype, so they only need
+        # to be replaced by None in the remaining columns, which may contain both kinds of nulls
+        expected_types = expected.dtypes.to_dict()
+        shared_columns = {
+            col
+            for col, dtype in actual_types.items()
+            if not is_object_dtype(dtype) and expected_types.get(col) == dtype
+        }
+        actual = _replace_nan_with_none(actual, skip_columns=shared_columns)
+        expected = _replace_nan_with_none(expected, skip_columns=shared_columns)
 
         if sort:
-            actual = actual.apply(lambda col: col.map(_to_hashable))
+            actual = _to_hashable_df(actual)
             actual = actual.sort_values(by=actual.columns.to_list()).reset_index(drop=True)
-            expected = expected.apply(lambda col: col.map(_to_hashable))
+            expected = _to_hashable_df(expected)
             expected = expected.sort_values(by=expected.columns.to_list()).reset_index(drop=True)
 
         try:
@@ -247,7 +282,8 @@ class ModelTest(unittest.TestCase):
                 expected,
                 actual,
                 check_dtype=False,
-                check_datetimelike_compat=True,
+                # Datetime-like values only need to be compared leniently when the dtypes differ
+                check_datetimelike_compat=not expected.dtypes.equals(actual.dtypes),
                 check_like=True,  # Ignore column order
             )
         except AssertionError as e:
@@ -266,8 +302,22 @@ class ModelTest(unittest.TestCase):
 
                 e.args = (error_msg,)
             else:
-                diff = expected.compare(actual).rename(columns={"self": "exp", "other": "act"})
-                e.args = (f"Data mismatch (exp: expected, act: actual)\n\n{diff}",)
+                # Only the first differing rows are compared, which bounds the size of the report
+                differing_rows = np.flatnonzero(
+                    ~(expected.eq(actual) | (expected.isna() & actual.isna())).all(axis=1)
+                )
+                shown_rows = differing_rows[:_MAX_DIFF_ROWS]
+                diff = (
+                    expected.iloc[shown_rows]
+                    .compare(actual.iloc[shown_rows])
+                    .rename(columns={"self": "exp", "other": "act"})
+                )
+
+                error_msg = f"Data mismatch (exp: expected, act: actual)\n\n{diff}"
+                if len(differing_rows) > len(shown_rows):
+                    error_msg += f"\n\n... and {len(differing_rows) - len(shown_rows)} more rows"
+
+                e.args = (error_msg,)
 
             raise e
 
@@ -466,30 +516,42 @@ class ModelTest(unittest.TestCase):
 
         return table
 
-    def _normalize_model_name(self, name: str, with_default_catalog: bool = True) -> str:
-        normalized_name = self._normalized_model_name_cache.get((name, with_default_catalog))
-        if normalized_name is None:
-            default_catalog = self.default_catalog if with_default_catalog else None
-            normalized_name = normalize_model_name(
-                name, default_catalog=default_catalog, dialect=self.dialect
-            )
-            self._normalized_model_name_cache[(name, with_default_catalog)] = normalized_name
+    @cached_property
+    def _model_fixture_tables(self) -> t.Dict[str, str]:
+        """Returns a mapping of all model names to their fixture tables."""
+        return {name: self._test_fixture_table(name).sql() for name in self.models}
 
-        return normalized_name
+    def _normalize_model_name(self, name: str, with_default_catalog: bool = True) -> str:
+        default_catalog = self.default_catalog if with_default_catalog else None
+        return _normalized_model_name(name, default_catalog, self.dialect)
 
     def _normalize_column_name(self, name: str) -> str:
-        normalized_name = self._normalized_column_name_cache.get(name)
-        if normalized_name is None:
-            normalized_name = normalize_identifiers(name, dialect=self.dialect).name
-            self._normalized_column_name_cache[name] = normalized_name
-
-        return normalized_name
+        return _normalized_column_name(name, self.dialect)
 
     def _execute(self, query: exp.Query) -> pd.DataFrame:
         """Executes the given query using the testing engine adapter and returns a DataFrame."""
-        with patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms):
+        with self._patch_transforms():
             return self.engine_adapter.fetchdf(query)
 
+    @contextmanager
+    def _patch_transforms(self) -> t.Iterator[None]:
+        # The transforms only differ from the dialect's ones when the CURRENT_* expressions are mocked
+        if not self._execution_time:
+            yield
+            return
+
+        # Swap the whole mapping, since `self._transforms` already extends the dialect's transforms
+        generator_class = self._test_adapter_dialect.generator_class
+        own_transforms = generator_class.__dict__.get("TRANSFORMS")
+        generator_class.TRANSFORMS = self._transforms
+        try:
+            yield
+        finally:
+            if own_transforms is None:
+                del generator_class.TRANSFORMS
+            else:
+                generator_class.TRANSFORMS = own_transforms
+
     def _create_df(
         self,
         values: t.Dict[str, t.Any],
@@ -501,14 +563,21 @@ class ModelTest(unittest.TestCase):
             return self._execute(self._add_missing_columns(query, columns))
 
         rows = values["rows"]
+        referenced_columns = list(dict.fromkeys(col for row in rows for col in row))
         if columns:
-            referenced_columns = list(dict.fromkeys(col for row in rows for col in row))
             _raise_if_unexpected_columns(columns, referenced_columns)
 
-            if partial:
-                columns = referenced_columns
+            if not partial:
+                referenced_columns = list(columns)
 
-        return pd.DataFrame.from_records(rows, columns=columns)
+        if not rows:
+            return pd.DataFrame(columns=referenced_columns)
+
+        # Building the frame column by column lets pandas allocate each column's array directly
+        return pd.DataFrame(
+            {col: [row.get(col) for row in rows] for col in referenced_columns},
+            columns=referenced_columns,
+        )
 
     def _add_missing_columns(
         self, query: exp.Query, all_columns: t.Optional[t.Collection[str]] = None
@@ -534,9 +603,10 @@ class SqlModelTest(ModelTest):
                         f"No CTE named {cte_name} found in model {self.model.name}", self.path
                     )
 
-                cte_query = ctes[cte_name].this
+                # The query is copied once and extended in place, instead of being copied per CTE
+                cte_query = ctes[cte_name].this.copy()
                 for alias, cte in ctes.items():
-                    cte_query = cte_query.with_(alias, cte.this)
+                    cte_query.with_(alias, cte.this.copy(), copy=False)
 
                 partial = values.get("partial")
                 sort = cte_query.args.get("order") is None
@@ -574,9 +644,7 @@ class SqlModelTest(ModelTest):
             **time_kwargs,
             variables=variables,
             engine_adapter=self.engine_adapter,
-            table_mapping={
-                name: self._test_fixture_table(name).sql() for name in self.body.get("inputs", {})
-            },
+            table_mapping=self._input_fixture_tables,
             runtime_stage=RuntimeStage.TESTING,
         )
         return query
@@ -642,8 +710,10 @@ class PythonModelTest(ModelTest):
 
     def _execute_model(self) -> pd.DataFrame:
         """Executes the python model and returns a DataFrame."""
+        from freezegun import freeze_time
+
         time_ctx = freeze_time(self._execution_time) if self._execution_time else nullcontext()
-        with patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms):
+        with self._patch_transforms():
             with t.cast(AbstractContextManager, time_ctx):
                 variables = self.body.get("vars", {}).copy()
                 time_kwargs = {
@@ -702,12 +772,12 @@ def generate_test(
     # ruamel.yaml does not support pandas Timestamps, so we must convert them to python
     # datetime or datetime.date objects based on column type
     inputs = {
-        models[dep].name: pandas_timestamp_to_pydatetime(
-            engine_adapter.fetchdf(query).apply(lambda col: col.map(_normalize_df_value)),
-            models[dep].columns_to_types,
+        models[dep].name: _records(
+            pandas_timestamp_to_pydatetime(
+                _normalize_df(engine_adapter.fetchdf(query)),
+                models[dep].columns_to_types,
+            ).replace({np.nan: None})
         )
-        .replace({np.nan: None})
-        .to_dict(orient="records")
         for dep, query in input_queries.items()
     }
     outputs: t.Dict[str, t.Any] = {"query": {}}
@@ -737,18 +807,16 @@ def generate_test(
             ctes = {}
             previous_ctes: t.List[exp.CTE] = []
             for cte in model_query.ctes:
-                cte_query = cte.this
+                cte_query = cte.this.copy()
                 for prev in previous_ctes:
-                    cte_query = cte_query.with_(prev.alias, prev.this)
+                    cte_query.with_(prev.alias, prev.this.copy(), copy=False)
 
                 cte_output = test._execute(cte_query)
-                ctes[cte.alias] = (
+                ctes[cte.alias] = _records(
                     pandas_timestamp_to_pydatetime(
-                        cte_output.apply(lambda col: col.map(_normalize_df_value)),
+                        _normalize_df(cte_output),
                         cte_query.named_selects,
-                    )
-                    .replace({np.nan: None})
-                    .to_dict(orient="records")
+                    ).replace({np.nan: None})
                 )
 
                 previous_ctes.append(cte)
@@ -760,12 +828,10 @@ def generate_test(
     else:
         output = t.cast(PythonModelTest, test)._execute_model()
 
-    outputs["query"] = (
-        pandas_timestamp_to_pydatetime(
-            output.apply(lambda col: col.map(_normalize_df_value)), model.columns_to_types
+    outputs["query"] = _records(
+        pandas_timestamp_to_pydatetime(_normalize_df(output), model.columns_to_types).replace(
+            {np.nan: None}
         )
-        .replace({np.nan: None})
-        .to_dict(orient="records")
     )
 
     test.tearDown()
@@ -789,20 +855,95 @@ def _raise_if_unexpected_columns(
 
 def _row_difference(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
     """Returns all rows in `left` that don't appear in `right`."""
-    rows_missing_from_right = []
-
-    # `None` replaces `np.nan` because `np.nan != np.nan` and this would affect the mapping lookup
-    right_row_count: t.MutableMapping[t.Tuple, int] = Counter(
-        right.replace({np.nan: None}).itertuples(index=False, name=None)
+    if left.columns.has_duplicates or right.columns.has_duplicates:
+        # Duplicate column names can't be matched by name, so the columns are matched by position
+        if len(left.columns) != len(right.columns):
+            return left.reset_index(drop=True)
+
+        positions = list(range(len(left.columns)))
+        return _row_difference(
+            left.set_axis(positions, axis=1), right.set_axis(positions, axis=1)
+        ).set_axis(left.columns, axis=1)
+
+    columns = left.columns.to_list()
+    if set(columns) != set(right.columns):
+        return left.reset_index(drop=True)
+
+    # Numbering the duplicates of each row turns the multiset difference into a regular
+    # left anti-join: the n-th copy of a row in `left` only matches the n-th copy in `right`
+    merged = _with_row_occurrence(left, columns).merge(
+        _with_row_occurrence(right, columns),
+        on=[*columns, _ROW_OCCURRENCE],
+        how="left",
+        indicator=True,
     )
-    for left_row in left.replace({np.nan: None}).itertuples(index=False):
-        left_row_tuple = tuple(left_row)
-        if right_row_count[left_row_tuple] <= 0:
-            rows_missing_from_right.append(left_row)
-        else:
-            right_row_count[left_row_tuple] -= 1
+    return left[(merged["_merge"] == "left_only").to_numpy()].reset_index(drop=True)
+
+
+def _with_row_occurrence(df: pd.DataFrame, columns: t.List[str]) -> pd.DataFrame:
+    # Values are compared as python objects so that the dtypes of both sides don't need to match,
+    # and `None` replaces `np.nan` because `np.nan != np.nan`
+    df = df.astype(object)
+    df = df.where(df.notna(), None)
+    return df.assign(**{_ROW_OCCURRENCE: df.groupby(columns, dropna=False, sort=False).cumcount()})
+
+
+def _infer_data_type(value: t.Any, dialect: Dialect) -> exp.DataType:
+    # The data type only needs to be inferred once for the Python types that always map to the same
+    # one, while the types of other values, e.g. containers, also depend on the values themselves
+    cacheable = type(value) in _CACHEABLE_SCALAR_TYPES
+    key = (type(value), dialect)
+    if cacheable and key in _SCALAR_DATA_TYPES:
+        return _SCALAR_DATA_TYPES[key].copy()
+
+    v_type = annotate_types(exp.convert(value)).type or type(value).__name__
+    data_type = exp.maybe_parse(v_type, into=exp.DataType, dialect=dialect)
+    if cacheable:
+        _SCALAR_DATA_TYPES[key] = data_type.copy()
+
+    return data_type
+
+
+def _replace_nan_with_none(df: pd.DataFrame, skip_columns: t.Collection[str]) -> pd.DataFrame:
+    columns = [col for col in dict.fromkeys(df.columns) if col not in skip_columns]
+    return df.replace({col: {np.nan: None} for col in columns}) if columns else df
+
+
+def _to_hashable(value: t.Any) -> t.Any:
+    if isinstance(value, (list, np.ndarray)):
+        return tuple(_to_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _to_hashable(v)) for k, v in value.items())
+    return str(value) if not isinstance(value, t.Hashable) else value
+
+
+def _to_hashable_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Makes all values in a DataFrame hashable, so that it can be sorted."""
+    hashable_columns = {
+        col: df[col].map(_to_hashable) for col in df.columns if _needs_hashable_map(df[col])
+    }
+    return df.assign(**hashable_columns) if hashable_columns else df
+
+
+def _needs_hashable_map(series: pd.Series) -> bool:
+    if is_object_dtype(series.dtype):
+        return infer_dtype(series, skipna=True) not in _HASHABLE_INFERRED_TYPES
+
+    # Mapping is a noop for numpy's numeric types, but it also normalizes other dtypes that the
+    # comparison depends on, e.g. datetime64[us] values are converted into datetime64[ns] ones
+    return not (isinstance(series.dtype, np.dtype) and series.dtype.kind in "iufb")
+
+
+# The normalized names are cached across tests, since the same model and column names tend to
+# show up in many of them
+@lru_cache(maxsize=None)
+def _normalized_model_name(name: str, default_catalog: str | None, dialect: str | None) -> str:
+    return normalize_model_name(name, default_catalog=default_catalog, dialect=dialect)
 
-    return pd.DataFrame(rows_missing_from_right)
+
+@lru_cache(maxsize=None)
+def _normalized_column_name(name: str, dialect: str | None) -> str:
+    return normalize_identifiers(name, dialect=dialect).name
 
 
 def _raise_error(msg: str, path: Path | None = None) -> None:
@@ -811,6 +952,26 @@ def _raise_error(msg: str, path: Path | None = None) -> None:
     raise TestError(msg)
 
 
+def _normalize_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize the object columns of a pandas dataframe, since only these can hold nested values."""
+    return df.assign(
+        **{
+            col: df[col].map(_normalize_df_value)
+            for col in df.columns
+            if is_object_dtype(df.dtypes[col])
+        }
+    )
+
+
+def _records(df: pd.DataFrame) -> t.List[t.Dict[str, t.Any]]:
+    """Same as `df.to_dict(orient="records")`, but unboxes the values one column at a time.
+
+    Object columns are expected to have gone through `_normalize_df` first, which boxes their values.
+    """
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in zip(*(col.tolist() for _, col in df.items()))]
+
+
 def _normalize_df_value(value: t.Any) -> t.Any:
     """Normalize data in a pandas dataframe so ruamel and sqlglot can deal with it."""
     if isinstance(value, (list, np.ndarray)):
@@ -821,4 +982,5 @@ def _normalize_df_value(value: t.Any) -> t.Any:
             # so we convert to {'key1': 10, 'key2': 20} (TODO: handle more dialects here)
             return {k: _normalize_df_value(v) for k, v in zip(value["key"], value["value"])}
         return {k: _normalize_df_value(v) for k, v in value.items()}
-    return value
+    # Object columns can hold numpy scalars, which `Series.tolist` does not unbox
+    return maybe_box_native(value)
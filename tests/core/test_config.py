@@ -702,3 +702,24 @@ model_defaults:
     assert isinstance(config.get_gateway("airflow_gateway").scheduler, AirflowSchedulerConfig)
     assert isinstance(config.get_gateway("mwaa_gateway").scheduler, MWAASchedulerConfig)
     assert isinstance(config.get_gateway("builtin_gateway").scheduler, BuiltInSchedulerConfig)
+
+
+def test_airflow_scheduler_config_reuses_session():
+    config = AirflowSchedulerConfig(airflow_url="https://airflow.url", token="test_token")
+
+    client_a = config.get_client()
+    client_b = config.get_client()
+
+    assert client_a._session is client_b._session
+    assert client_a._session.headers["Authorization"] == "Bearer test_token"
+
+    adapter = client_a._session.get_adapter("https://airflow.url")
+    assert adapter.max_retries.total == 3
+    assert config == AirflowSchedulerConfig(airflow_url="https://airflow.url", token="test_token")
+
+
+def test_scheduler_config_is_frozen():
+    config = AirflowSchedulerConfig(airflow_url="https://airflow.url")
+
+    with pytest.raises((TypeError, ValueError)):
+        config.airflow_url = "https://other.url"
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import datetime
 import typing as t
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import call
 
+import numpy as np
 import pandas as pd
 import pytest
 from pytest_mock.plugin import MockerFixture
-from sqlglot import exp
+from sqlglot import Dialect, exp
 
 from sqlmesh.cli.example_project import init_example_project
 from sqlmesh.core import constants as c
@@ -24,7 +26,15 @@ from sqlmesh.core.dialect import parse
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.macros import MacroEvaluator, macro
 from sqlmesh.core.model import Model, SqlModel, load_sql_based_model, model
-from sqlmesh.core.test.definition import ModelTest, PythonModelTest, SqlModelTest
+from sqlmesh.core.test.definition import (
+    ModelTest,
+    PythonModelTest,
+    SqlModelTest,
+    _infer_data_type,
+    _normalize_df,
+    _records,
+    _row_difference,
+)
 from sqlmesh.utils.errors import ConfigError, TestError
 from sqlmesh.utils.yaml import dump as dump_yaml
 from sqlmesh.utils.yaml import load as load_yaml
@@ -850,6 +860,48 @@ test_foo:
     )
 
 
+def test_infer_data_type() -> None:
+    dialect = Dialect.get_or_raise("duckdb")
+
+    # The data type of decimals depends on their value, so it must not be cached per Python type
+    assert _infer_data_type(Decimal("1"), dialect).sql() == "INT"
+    assert _infer_data_type(Decimal("1.5"), dialect).sql() == "DOUBLE"
+    assert _infer_data_type(Decimal("1"), dialect).sql() == "INT"
+
+    assert _infer_data_type([1], dialect).sql() == "ARRAY<INT>"
+    assert _infer_data_type(["a"], dialect).sql() == "ARRAY<VARCHAR>"
+
+    # Cached data types are copied, so that callers can't modify each other's types
+    first = _infer_data_type("a", dialect)
+    second = _infer_data_type("b", dialect)
+    assert first.sql() == second.sql() == "VARCHAR"
+    assert first is not second
+
+    assert _infer_data_type(1, dialect).sql() == "INT"
+    assert _infer_data_type(True, dialect).sql() == "BOOLEAN"
+    assert _infer_data_type(datetime.date(2024, 1, 1), dialect).sql() == "DATE"
+    assert _infer_data_type(datetime.datetime(2024, 1, 1), dialect).sql() == "TIMESTAMP"
+
+
+def test_records_box_numpy_scalars() -> None:
+    df = pd.DataFrame(
+        {
+            "a": pd.Series([np.int64(1), "x"], dtype=object),
+            "b": pd.Series([[np.float64(1.5)], {"key": ["k"], "value": [np.int64(2)]}]),
+            "c": [1, 2],
+        }
+    )
+
+    records = _records(_normalize_df(df))
+    assert records == [{"a": 1, "b": [1.5], "c": 1}, {"a": "x", "b": {"k": 2}, "c": 2}]
+    assert type(records[0]["a"]) is int
+    assert type(records[0]["b"][0]) is float
+    assert type(records[1]["b"]["k"]) is int
+    assert type(records[0]["c"]) is int
+
+    assert dump_yaml(records)
+
+
 def test_missing_column_failure(sushi_context: Context, full_model_without_ctes: SqlModel) -> None:
     _check_successful_or_raise(
         _create_test(
@@ -971,6 +1023,57 @@ test_foo:
     )
 
 
+def test_row_difference() -> None:
+    left = pd.DataFrame({"id": [1, 1, 1, 2, None], "value": ["a", "a", "a", None, "b"]})
+    right = pd.DataFrame({"value": ["a", None, "b", "a"], "id": [1.0, 2.0, float("nan"), 3.0]})
+
+    missing = _row_difference(left, right)
+    assert missing.to_dict(orient="records") == [
+        {"id": 1.0, "value": "a"},
+        {"id": 1.0, "value": "a"},
+    ]
+
+    unexpected = _row_difference(right, left)
+    assert unexpected.to_dict(orient="records") == [{"value": "a", "id": 3.0}]
+
+    # Duplicate column names are matched by position
+    left = pd.DataFrame([[1, 2], [3, 4], [3, 4]], columns=["a", "a"])
+    right = pd.DataFrame([[3, 4], [5, 6]], columns=["a", "a"])
+
+    missing = _row_difference(left, right)
+    assert missing.columns.to_list() == ["a", "a"]
+    assert missing.values.tolist() == [[1, 2], [3, 4]]
+    assert _row_difference(right, left).values.tolist() == [[5, 6]]
+
+
+def test_data_mismatch_report_is_capped() -> None:
+    test = _create_test(
+        body=load_yaml(
+            """
+test_foo:
+  model: xyz
+  outputs:
+    query:
+      - a: 1
+            """
+        ),
+        test_name="test_foo",
+        model=_create_model("SELECT 1 AS a"),
+        context=Context(config=Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))),
+    )
+
+    expected = pd.DataFrame({"a": range(60), "b": [None] * 60})
+    actual = pd.DataFrame({"a": [i + 1 for i in range(60)], "b": [None] * 60})
+
+    with pytest.raises(AssertionError) as ex:
+        test.assert_equal(expected, actual, sort=False)
+
+    error_msg = str(ex.value)
+    assert "49  49  50" in error_msg
+    assert "50  50  51" not in error_msg
+    assert error_msg.endswith("... and 10 more rows")
+
+
 def test_unknown_column_error() -> None:
     _check_successful_or_raise(
         _create_test(
@@ -1176,9 +1279,15 @@ test_foo:
         context=Context(config=Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))),
     )
 
+    generator_class = test._test_adapter_dialect.generator_class
+    transforms = generator_class.TRANSFORMS
+
     spy_execute = mocker.spy(test.engine_adapter, "_execute")
     _check_successful_or_raise(test.run())
 
+    # The mocked CURRENT_* transforms must not leak out of the test
+    assert generator_class.TRANSFORMS is transforms
+
     spy_execute.assert_has_calls(
         [
             call('CREATE SCHEMA IF NOT EXISTS "memory"."sqlmesh_test_jzngz56a"'),